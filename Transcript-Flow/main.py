@@ -13,20 +13,31 @@ from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+import asyncio
 import json
+import logging
+import mmap
 import time
 import shutil
+import socket
 import tempfile
 import re
+import subprocess
+import sys
+import threading
 import zipfile
 import uuid
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 
 import pandas as pd
-from docx import Document
+from lxml import etree
 import assemblyai as aai
 
 # Try to import docx2pdf, but handle if not available (Linux)
@@ -36,6 +47,28 @@ try:
 except ImportError:
     DOCX2PDF_AVAILABLE = False
 
+# Try to import the LibreOffice UNO bridge (available in LibreOffice's Python)
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    UNO_AVAILABLE = True
+except ImportError:
+    UNO_AVAILABLE = False
+
+# Try to import orjson for faster JSON parsing, fall back to the standard library
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import tiktoken for token counting, fall back to a character estimate
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -53,6 +86,23 @@ EXCEL_PATH = os.getenv("EXCEL_PATH", "./files/Paraplanner_Extraction and Rules_v
 SHEET_NAME = os.getenv("SHEET_NAME", "Extraction Fields_JSON")
 TEMPLATE_PATH = os.getenv("TEMPLATE_PATH", "./files/latest_but_modifie.docx")
 OUTPUT_DIR = os.getenv("OUTPUT_DIR", "./outputs")
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
+# PDF conversion - a long-lived unoserver (headless LibreOffice) is reused across conversions on Linux
+UNOSERVER_HOST = os.getenv("UNOSERVER_HOST", "127.0.0.1")
+UNOSERVER_PORT = int(os.getenv("UNOSERVER_PORT", "2003"))
+UNOSERVER_START_TIMEOUT = float(os.getenv("UNOSERVER_START_TIMEOUT", "60"))
+
+# PDF generation runs in worker processes; each worker owns a unoserver on its own pair of ports
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(max(1, (os.cpu_count() or 2) // 2))))
+
+# Token budget - transcripts that don't fit are split into overlapping chunks
+MODEL_CONTEXT_TOKENS = int(os.getenv("MODEL_CONTEXT_TOKENS", "1048576"))
+MODEL_OUTPUT_TOKENS = int(os.getenv("MODEL_OUTPUT_TOKENS", "65536"))
+TRANSCRIPT_CHUNK_OVERLAP_TOKENS = int(os.getenv("TRANSCRIPT_CHUNK_OVERLAP_TOKENS", "2000"))
+
+logging.basicConfig(level=LOG_LEVEL, format="%(message)s")
+logger = logging.getLogger(__name__)
 
 # Initialize AssemblyAI
 if ASSEMBLYAI_API_KEY:
@@ -92,6 +142,13 @@ app.add_middleware(
 # Store for tracking processed files
 processed_files: Dict[str, dict] = {}
 
+# Single worker for output file writes so they stay off the request's critical path
+io_executor = ThreadPoolExecutor(max_workers=1)
+
+# Worker processes for PDF generation, created at startup and replaced if a worker dies
+pdf_executor: Optional[ProcessPoolExecutor] = None
+pdf_executor_lock = asyncio.Lock()
+
 # =============================================================================
 # TEMPLATE MAPPING CONFIG
 # =============================================================================
@@ -339,54 +396,115 @@ def transcribe_with_diarization(audio_path: str) -> tuple:
         print(f"Transcription failed: {transcript.error}")
         return None, None
     
-    formatted_transcript = ""
-    plain_transcript = ""
-    
-    for utterance in transcript.utterances:
-        formatted_transcript += f"Speaker {utterance.speaker}: {utterance.text}\n"
-        plain_transcript += f"{utterance.text} "
+    utterances = transcript.utterances
+    formatted_transcript = ''.join(
+        f"Speaker {utterance.speaker}: {utterance.text}\n" for utterance in utterances
+    )
+    plain_transcript = ' '.join(utterance.text for utterance in utterances)
     
     return formatted_transcript, plain_transcript.strip()
 
 
+# WordprocessingML namespace, and how python-docx renders run content as text
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_RUN_TEXT = {_W + 'tab': '\t', _W + 'ptab': '\t', _W + 'cr': '\n', _W + 'noBreakHyphen': '-'}
+_DOCX_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+_OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
+
+def _run_text(run) -> str:
+    """Text of a w:r element, as python-docx's Run.text renders it."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W + 't':
+            parts.append(child.text or '')
+        elif tag == _W + 'br':
+            if child.get(_W + 'type', 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag in _W_RUN_TEXT:
+            parts.append(_W_RUN_TEXT[tag])
+    return ''.join(parts)
+
+
 def read_docx_transcript(docx_path: str) -> str:
     """Read transcript from a DOCX file"""
-    doc = Document(docx_path)
+    # Parse the main document part directly instead of building python-docx objects
+    with zipfile.ZipFile(docx_path) as zf:
+        part_name = 'word/document.xml'
+        rels = etree.fromstring(zf.read('_rels/.rels'), _DOCX_PARSER)
+        for rel in rels.iter(_PKG_REL):
+            if rel.get('Type') == _OFFICE_DOCUMENT_REL:
+                part_name = rel.get('Target').lstrip('/')
+                break
+        root = etree.fromstring(zf.read(part_name), _DOCX_PARSER)
+    
+    body = root.find(_W + 'body')
     transcript_text = []
-    for para in doc.paragraphs:
-        if para.text.strip():
-            transcript_text.append(para.text)
+    for para in (body if body is not None else ()):
+        if para.tag != _W + 'p':
+            continue
+        parts = []
+        for child in para:
+            if child.tag == _W + 'r':
+                parts.append(_run_text(child))
+            elif child.tag == _W + 'hyperlink':
+                parts.extend(_run_text(run) for run in child.iterchildren(_W + 'r'))
+        text = ''.join(parts)
+        if text.strip():
+            transcript_text.append(text)
     return '\n'.join(transcript_text)
 
 
+_RE_VTT_VOICE = re.compile(r'<v\s+([^>]+)>')
+_RE_VTT_TAG = re.compile(r'</?[^>]+>')
+
+
 def read_vtt_transcript(vtt_path: str) -> str:
     """Read transcript from a VTT (WebVTT) file"""
-    with open(vtt_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    content = re.sub(r'^WEBVTT.*?\n\n', '', content, flags=re.MULTILINE)
-    blocks = content.split('\n\n')
     transcript_lines = []
     
-    for block in blocks:
-        lines = block.strip().split('\n')
-        if not lines or not lines[0].strip():
-            continue
-        text_lines = [line for line in lines if '-->' not in line]
-        for line in text_lines:
-            line = line.strip()
-            if line and not line.isdigit():
-                line = re.sub(r'<v\s+([^>]+)>', r'\1: ', line)
-                line = re.sub(r'</?[^>]+>', '', line)
-                transcript_lines.append(line)
+    def add_line(line: str):
+        if '-->' in line:
+            return
+        line = line.strip()
+        if line and not line.isdigit():
+            line = _RE_VTT_VOICE.sub(r'\1: ', line)
+            line = _RE_VTT_TAG.sub('', line)
+            transcript_lines.append(line)
+    
+    # Stream the file; a WEBVTT header line is dropped when a blank line follows it
+    header_line = None
+    with open(vtt_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if header_line is not None:
+                if line:
+                    add_line(header_line)
+                header_line = None
+            if line.startswith('WEBVTT'):
+                header_line = line
+            else:
+                add_line(line)
+    if header_line is not None:
+        add_line(header_line)
     
     return '\n'.join(transcript_lines)
 
 
 def read_txt_transcript(txt_path: str) -> str:
     """Read transcript from a plain text file"""
-    with open(txt_path, 'r', encoding='utf-8') as f:
-        return f.read()
+    with open(txt_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        # Decode straight from the mapped pages instead of through a text buffer
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            text = str(mm, 'utf-8')
+    # Same universal-newline handling as text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 def read_transcript(file_path: str) -> str:
@@ -411,8 +529,8 @@ def read_transcript(file_path: str) -> str:
 # =============================================================================
 
 def load_field_definitions_from_excel(excel_path: str, sheet_name: str) -> Dict[str, Dict[str, str]]:
-    """Load field definitions from Excel"""
-    print(f"Loading field definitions from {excel_path}...")
+    """Load field definitions from Excel as {section: {field: description}}"""
+    logger.info("Loading field definitions from %s...", excel_path)
     
     df = pd.read_excel(excel_path, sheet_name=sheet_name)
     df = df[df['Field'].notna()]
@@ -420,18 +538,16 @@ def load_field_definitions_from_excel(excel_path: str, sheet_name: str) -> Dict[
     field_schema = {}
     
     for _, row in df.iterrows():
-        field_name = str(row['Field']).strip()
-        description = str(row['Description']).strip() if pd.notna(row.get('Description')) else ''
-        section = str(row['Section / Data Category']).strip() if pd.notna(row.get('Section / Data Category')) else ''
+        field_name = sys.intern(str(row['Field']).strip())
+        description = sys.intern(str(row['Description']).strip()) if pd.notna(row.get('Description')) else ''
+        section = sys.intern(str(row['Section / Data Category']).strip()) if pd.notna(row.get('Section / Data Category')) else ''
         
         if section not in field_schema:
             field_schema[section] = {}
         
-        field_schema[section][field_name] = {
-            'description': description
-        }
+        field_schema[section][field_name] = description
     
-    print(f"✓ Loaded {len(field_schema)} sections with field definitions")
+    logger.info("✓ Loaded %d sections with field definitions", len(field_schema))
     return field_schema
 
 
@@ -439,22 +555,88 @@ def create_json_schema(field_schema: Dict[str, Dict[str, str]]) -> str:
     """Create JSON schema string from field schema"""
     schema_lines = []
     for section, fields in field_schema.items():
-        for field_name, metadata in fields.items():
-            description = metadata['description']
+        for field_name, description in fields.items():
             schema_line = f'  "{section}" -> "{field_name}" : {description}'
             schema_lines.append(schema_line)
     return '\n'.join(schema_lines)
 
 
-def extract_all_fields(transcript: str, field_schema: Dict[str, Dict[str, str]]) -> str:
-    """Extract ALL fields in a SINGLE API call"""
-    print(f"Extracting ALL {len(field_schema)} sections in a SINGLE API call...")
+@functools.lru_cache(maxsize=1)
+def get_token_encoder():
+    """Get the shared tiktoken encoder (None if tiktoken is unavailable)"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model(CHAT_DAILOQA_LLM_MODEL or "")
+    except KeyError:
+        pass
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning("  Could not load tiktoken encoding, estimating tokens: %s", e)
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Count tokens in text (roughly 4 characters per token without tiktoken)"""
+    encoder = get_token_encoder()
+    if encoder is None:
+        return (len(text) + 3) // 4
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+@functools.lru_cache(maxsize=32)
+def count_tokens(text: str) -> int:
+    """Count tokens in a whole prompt or transcript, cached so repeated ones are not re-tokenised"""
+    return _count_tokens(text)
+
+
+@functools.lru_cache(maxsize=4)
+def split_transcript(transcript: str, max_tokens: int, overlap_tokens: int) -> Tuple[str, ...]:
+    """Split a transcript on line boundaries into chunks of at most max_tokens,
+    repeating up to overlap_tokens of trailing lines at the start of the next chunk"""
+    if max_tokens < 1:
+        raise ValueError(f"Transcript chunk size must be at least 1 token, got {max_tokens}")
     
-    current_date = datetime.now().strftime("%d-%B-%Y")
-    schema_string = create_json_schema(field_schema)
-    total_fields = sum(len(fields) for fields in field_schema.values())
-    print(f"  Total fields to extract: {total_fields}")
+    # Lines are counted uncached so they don't evict whole-transcript counts from count_tokens
+    paragraphs = []
+    for line in transcript.split('\n'):
+        tokens = _count_tokens(line) + 1
+        if tokens <= max_tokens:
+            paragraphs.append((line, tokens))
+            continue
+        # A single line larger than the budget is cut into equal character slices
+        pieces = -(-tokens // max_tokens)
+        step = -(-len(line) // pieces)
+        for i in range(0, len(line), step):
+            piece = line[i:i + step]
+            paragraphs.append((piece, _count_tokens(piece) + 1))
+    
+    chunks = []
+    current = []
+    current_tokens = 0
+    for paragraph, tokens in paragraphs:
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append('\n'.join(p for p, _ in current))
+            overlap = []
+            overlap_total = 0
+            for p, t in reversed(current):
+                if overlap_total + t > overlap_tokens or overlap_total + t + tokens > max_tokens:
+                    break
+                overlap.insert(0, (p, t))
+                overlap_total += t
+            current = overlap
+            current_tokens = overlap_total
+        current.append((paragraph, tokens))
+        current_tokens += tokens
+    if current:
+        chunks.append('\n'.join(p for p, _ in current))
     
+    return tuple(chunks)
+
+
+def build_extraction_prompt(transcript: str, schema_string: str) -> str:
+    """Build the reasoning-step extraction prompt for a transcript"""
     prompt = f"""
 You are a financial data extraction assistant SPECIFICALLY FOR THE CLIENT (NOT THE ADVISER). Analyze the following conversation transcript between a financial advisor and client.
 
@@ -613,11 +795,50 @@ WARNING : DO NOT ASSUME OR ADD INFORMATION THAT IS NOT THERE IN THE TRANSCRIPT.
 
 START THE EXTRACTION NOW as per the strict **OUTPUT FORMAT**
 """
+    return prompt
+
+
+def extract_all_fields(transcript: str, field_schema: Dict[str, Dict[str, str]]) -> str:
+    """Extract ALL fields in a SINGLE API call (one call per chunk for oversized transcripts)"""
+    schema_string = create_json_schema(field_schema)
     
-    print("  Sending request to Gemini API...")
-    response = chat.invoke(prompt)
-    response_text = response.content
-    return response_text
+    prompt_tokens = count_tokens(build_extraction_prompt("", schema_string))
+    transcript_budget = MODEL_CONTEXT_TOKENS - MODEL_OUTPUT_TOKENS - prompt_tokens
+    if transcript_budget <= TRANSCRIPT_CHUNK_OVERLAP_TOKENS:
+        raise ValueError(
+            f"No room for the transcript: MODEL_CONTEXT_TOKENS ({MODEL_CONTEXT_TOKENS}) minus "
+            f"MODEL_OUTPUT_TOKENS ({MODEL_OUTPUT_TOKENS}) and the {prompt_tokens}-token prompt leaves "
+            f"{transcript_budget} tokens, which must exceed TRANSCRIPT_CHUNK_OVERLAP_TOKENS "
+            f"({TRANSCRIPT_CHUNK_OVERLAP_TOKENS})"
+        )
+    transcript_tokens = count_tokens(transcript)
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Extracting ALL %d sections in a SINGLE API call...\n"
+            "  Total fields to extract: %d\n"
+            "  Transcript tokens: %d (budget: %d)",
+            len(field_schema),
+            sum(len(fields) for fields in field_schema.values()),
+            transcript_tokens,
+            transcript_budget
+        )
+    
+    if transcript_tokens <= transcript_budget:
+        logger.info("  Sending request to Gemini API...")
+        response = chat.invoke(build_extraction_prompt(transcript, schema_string))
+        return response.content
+    
+    chunks = split_transcript(transcript, transcript_budget, TRANSCRIPT_CHUNK_OVERLAP_TOKENS)
+    logger.info("  Transcript exceeds model context, sending %d chunks to Gemini API...", len(chunks))
+    
+    def extract_chunk(chunk: str) -> str:
+        return chat.invoke(build_extraction_prompt(chunk, schema_string)).content
+    
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        chunk_outputs = list(executor.map(extract_chunk, chunks))
+    
+    return "\n\n".join(chunk_outputs)
 
 
 def generate_json(extracted_json: str) -> str:
@@ -658,7 +879,7 @@ OUTPUT FORMAT:
 }}
 """
 
-    print("Sending request to Gemini API...")
+    logger.info("Sending request to Gemini API...")
     response = chat.invoke(prompt)
     response_text = response.content
 
@@ -675,30 +896,312 @@ OUTPUT FORMAT:
     return response_text
 
 
+_RE_REASONING_HEADER = re.compile(r'^\[([^\]]+)\]\s*$')
+_RE_REASONING_KEY = re.compile(r'^\s*(Section_name|field_name|Evidence|Value|Reason)\s*:\s*(.*)$', re.IGNORECASE)
+_RE_REASONING_INLINE_REASON = re.compile(r'\s*\|\s*Reason\s*:.*$', re.DOTALL)
+_NOT_FOUND_VALUES = ("", "not found", "not available")
+# Free-text fields each chunk of a split transcript fills from its own part (as do all "... Soft Notes")
+_NARRATIVE_FIELDS = frozenset({
+    "Executive Summary", "Summary of Discussion", "Actions & Recommendations", "Next Steps"
+})
+
+
+def parse_reasoning(extracted_output: str, field_schema: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+    """Parse the reasoning step's per-field blocks into the final JSON structure.
+    
+    Each block looks like:
+        [1. Personal Details]
+        Section_name: **Personal Details**
+        field_name : **Client Name(s)**
+        Evidence: "..." (Page 1)
+        Value: George Williams | Reason: ...
+    
+    Values may continue over several lines. Schema fields missing from the output
+    are set to "Not found". When a field appears more than once (e.g. from chunked
+    extraction), found values of narrative and soft-notes fields are combined line by
+    line; for other fields the first value that was actually found wins.
+    """
+    section_keys = {}
+    for section in field_schema:
+        section_keys[section] = section
+        section_keys.setdefault(section.split('. ', 1)[-1], section)
+    
+    def clean_name(name: str) -> str:
+        return name.strip().strip('*').strip()
+    
+    blocks = []
+    current = None
+    current_key = None
+    
+    for line in extracted_output.splitlines():
+        stripped = line.strip()
+        if stripped.startswith('```') or stripped == '---':
+            continue
+        
+        header = _RE_REASONING_HEADER.match(stripped)
+        key_match = _RE_REASONING_KEY.match(line)
+        key = key_match.group(1).lower() if key_match else None
+        
+        if header or (key == 'section_name' and current is not None and 'field_name' in current):
+            current = {}
+            blocks.append(current)
+            current_key = None
+            if header:
+                current['header'] = [header.group(1)]
+                continue
+        
+        if key:
+            if current is None:
+                current = {}
+                blocks.append(current)
+            current[key] = [key_match.group(2)]
+            current_key = key
+        elif current_key is not None:
+            current[current_key].append(line)
+    
+    result = {section: {field: "Not found" for field in fields} for section, fields in field_schema.items()}
+    
+    for block in blocks:
+        if 'field_name' not in block or 'value' not in block:
+            continue
+        
+        section_name = clean_name(' '.join(block.get('section_name', [])))
+        header_name = clean_name(' '.join(block.get('header', [])))
+        section = section_keys.get(section_name) or section_keys.get(header_name) or section_name or header_name
+        field_name = clean_name(' '.join(block['field_name']))
+        value = _RE_REASONING_INLINE_REASON.sub('', '\n'.join(block['value'])).strip()
+        
+        section_data = result.setdefault(section, {})
+        existing = section_data.get(field_name)
+        if existing is None or existing.strip().lower() in _NOT_FOUND_VALUES:
+            section_data[field_name] = value
+        elif value.strip().lower() in _NOT_FOUND_VALUES or value in existing:
+            continue
+        elif field_name in _NARRATIVE_FIELDS or field_name.endswith("Soft Notes"):
+            section_data[field_name] = f"{existing}\n{value}"
+        else:
+            logger.debug("  Keeping first value for %s / %s, ignoring %r", section, field_name, value)
+    
+    return result
+
+
 # =============================================================================
 # PDF GENERATION FUNCTIONS
 # =============================================================================
 
+# WordprocessingML font/alignment elements fix_fonts rewrites
+_W_RFONTS = _W + 'rFonts'
+_W_JC = _W + 'jc'
+_W_PPR_TAGS = (_W + 'pPr', _W + 'pPrDefault')
+_RE_NORMALIZE = re.compile(r'[^a-z0-9\s]')
+_EMPTY_VALUES = frozenset({"not available", "not found", "na", "n a", "none", "null", ""})
+_EMPTY_VALUE_MAX_LENGTH = 40
+
+def atomic_write(file_path: str, data: bytes):
+    """Write bytes to a temp file and atomically move it into place."""
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, file_path)
+
+
 def load_json_file(file_path: str) -> dict:
-    """Load a JSON file."""
+    """Load a JSON file, reusing the parsed data until the file changes.
+    
+    The returned dict is shared between calls and must not be modified.
+    """
+    return _load_json_cached(file_path, os.path.getmtime(file_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_cached(file_path: str, mtime: float) -> dict:
+    """Parse a JSON file; mtime is only part of the cache key."""
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+# Supervised unoserver process; LibreOffice stays loaded between conversions
+office_process: Optional[subprocess.Popen] = None
+office_lock = threading.Lock()
+# Set once the server fails to come up, so this process stops relaunching it
+office_unavailable = False
+# Overridden per PDF worker so each worker talks to its own server (uno port is office_port - 1)
+office_port = UNOSERVER_PORT
+# UNO Desktop of the running server, connected on first conversion
+office_desktop = None
+uno_lock = threading.Lock()
+
+
+def wait_for_office_server(process: subprocess.Popen, timeout: float) -> bool:
+    """Wait until the server accepts connections on office_port; False if it exits or times out."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((UNOSERVER_HOST, office_port), timeout=1):
+                return True
+        except OSError:
+            time.sleep(0.25)
+    return False
+
+
+def start_office_server() -> bool:
+    """Start the headless LibreOffice server if it is not already running."""
+    global office_process, office_desktop, office_unavailable
+    if DOCX2PDF_AVAILABLE or office_unavailable or not shutil.which("unoserver"):
+        return False
+    if not UNO_AVAILABLE and not shutil.which("unoconvert"):
+        return False
+    
+    with office_lock:
+        if office_process is not None and office_process.poll() is None:
+            return True
+        office_desktop = None
+        # A profile per server, so several servers don't lock each other's user installation
+        profile_dir = os.path.join(tempfile.gettempdir(), f"lo_profile_{os.getpid()}")
+        # Server output goes to a file (a pipe could fill up and stall it) and is logged on failure
+        log_path = os.path.join(tempfile.gettempdir(), f"unoserver_{os.getpid()}.log")
+        try:
+            with open(log_path, 'wb') as log_file:
+                office_process = subprocess.Popen(
+                    ['unoserver', '--interface', UNOSERVER_HOST,
+                     '--port', str(office_port), '--uno-port', str(office_port - 1),
+                     '--user-installation', profile_dir],
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT
+                )
+        except Exception as e:
+            logger.error("  Error starting LibreOffice server: %s", e)
+            office_process = None
+            office_unavailable = True
+            return False
+        
+        if not wait_for_office_server(office_process, UNOSERVER_START_TIMEOUT):
+            if office_process.poll() is None:
+                office_process.kill()
+                office_process.wait()
+            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                output = f.read()[-2000:].strip()
+            logger.error(
+                "  LibreOffice server did not start on %s:%d (exit code %s); "
+                "using one-off LibreOffice processes instead.\n%s",
+                UNOSERVER_HOST, office_port, office_process.returncode, output
+            )
+            office_process = None
+            office_unavailable = True
+            return False
+        
+        logger.info("  ✓ LibreOffice server started on %s:%d", UNOSERVER_HOST, office_port)
+        return True
+
+
+def stop_office_server():
+    """Stop the headless LibreOffice server."""
+    global office_process
+    with office_lock:
+        if office_process is not None and office_process.poll() is None:
+            office_process.terminate()
+            try:
+                office_process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                office_process.kill()
+        office_process = None
+
+
+def uno_property(name: str, value) -> "PropertyValue":
+    """Build a UNO PropertyValue."""
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+
+def convert_with_uno(docx_path: str, output_pdf_path: str):
+    """Convert a DOCX file to PDF on the running LibreOffice server through the UNO bridge."""
+    global office_desktop
+    with uno_lock:
+        try:
+            if office_desktop is None:
+                local_context = uno.getComponentContext()
+                resolver = local_context.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.bridge.UnoUrlResolver", local_context
+                )
+                context = resolver.resolve(
+                    f"uno:socket,host={UNOSERVER_HOST},port={office_port - 1};urp;StarOffice.ComponentContext"
+                )
+                office_desktop = context.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.frame.Desktop", context
+                )
+            
+            document = office_desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(os.path.abspath(docx_path)), "_blank", 0,
+                (uno_property("Hidden", True),)
+            )
+            try:
+                document.storeToURL(
+                    uno.systemPathToFileUrl(os.path.abspath(output_pdf_path)),
+                    (uno_property("FilterName", "writer_pdf_Export"),)
+                )
+            finally:
+                document.close(True)
+        except Exception:
+            # The bridge may be dead (e.g. the server restarted); reconnect on the next call
+            office_desktop = None
+            raise
+
+
+def init_pdf_worker(worker_counter):
+    """Give a PDF worker process its own LibreOffice server."""
+    global office_port
+    with worker_counter.get_lock():
+        worker_index = worker_counter.value
+        worker_counter.value += 1
+    office_port = UNOSERVER_PORT + 2 * worker_index
+    # Worker processes skip atexit, so stop the server from multiprocessing's exit hook
+    multiprocessing.util.Finalize(None, stop_office_server, exitpriority=10)
+    # An exception here would break the whole pool, so failures are logged and
+    # run_pdf_generation retries on its first request
+    try:
+        start_office_server()
+        # Unpack and font-fix the template now instead of on this worker's first request
+        if os.path.exists(TEMPLATE_PATH):
+            get_prepared_template(TEMPLATE_PATH)
+    except Exception as e:
+        logger.error("  ✗ PDF worker warm-up failed, retrying on first request: %s", e)
+
+
 def convert_docx_to_pdf(docx_path: str, output_pdf_path: str) -> bool:
     """Convert a DOCX file to PDF."""
     if DOCX2PDF_AVAILABLE:
         try:
             docx2pdf_convert(docx_path, output_pdf_path)
-            print(f"  Converted to PDF: {output_pdf_path}")
+            logger.info("  Converted to PDF: %s", output_pdf_path)
             return True
         except Exception as e:
-            print(f"  Error converting to PDF: {e}")
+            logger.error("  Error converting to PDF: %s", e)
             return False
     else:
-        # On Linux, try using LibreOffice
+        # On Linux, prefer the running LibreOffice server (restarted here if it died)
+        if start_office_server():
+            try:
+                if UNO_AVAILABLE:
+                    convert_with_uno(docx_path, output_pdf_path)
+                else:
+                    subprocess.run([
+                        'unoconvert', '--host', UNOSERVER_HOST, '--port', str(office_port),
+                        '--convert-to', 'pdf', docx_path, output_pdf_path
+                    ], check=True, timeout=120)
+                logger.info("  Converted to PDF: %s", output_pdf_path)
+                return True
+            except Exception as e:
+                logger.warning("  LibreOffice server conversion failed, falling back to a new process: %s", e)
+        
+        # Otherwise start a one-off LibreOffice process
         try:
-            import subprocess
             output_dir = os.path.dirname(output_pdf_path)
             subprocess.run([
                 'libreoffice', '--headless', '--convert-to', 'pdf',
@@ -709,83 +1212,68 @@ def convert_docx_to_pdf(docx_path: str, output_pdf_path: str) -> bool:
             generated_pdf = os.path.join(output_dir, f"{base_name}.pdf")
             if generated_pdf != output_pdf_path:
                 shutil.move(generated_pdf, output_pdf_path)
-            print(f"  Converted to PDF: {output_pdf_path}")
+            logger.info("  Converted to PDF: %s", output_pdf_path)
             return True
         except Exception as e:
-            print(f"  Error converting to PDF with LibreOffice: {e}")
+            logger.error("  Error converting to PDF with LibreOffice: %s", e)
             return False
 
 
-def fix_fonts(unpacked_dir: str, font_name: str = "Arial"):
-    """Replace all fonts with a universal font and fix text alignment."""
-    
-    def process_xml_file(file_path: str):
-        if not os.path.exists(file_path):
-            return False
-            
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        content = re.sub(
-            r'<w:rFonts[^>]*/>', 
-            f'<w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}" w:eastAsia="{font_name}"/>', 
-            content
-        )
-        
-        content = re.sub(
-            r'<w:rFonts[^>]*>.*?</w:rFonts>', 
-            f'<w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}" w:eastAsia="{font_name}"/>', 
-            content,
-            flags=re.DOTALL
-        )
-        
-        content = re.sub(r'\s*w:asciiTheme="[^"]*"', '', content)
-        content = re.sub(r'\s*w:hAnsiTheme="[^"]*"', '', content)
-        content = re.sub(r'\s*w:cstheme="[^"]*"', '', content)
-        content = re.sub(r'\s*w:eastAsiaTheme="[^"]*"', '', content)
-        
-        content = re.sub(r'<w:jc\s+w:val\s*=\s*"both"\s*/>', '<w:jc w:val="left"/>', content)
-        content = re.sub(r'<w:jc\s+w:val\s*=\s*"both"\s*>', '<w:jc w:val="left">', content)
-        
-        def replace_both_in_jc(match):
-            return match.group(0).replace('"both"', '"left"').replace("'both'", "'left'")
-        
-        content = re.sub(r'<w:jc[^>]*>', replace_both_in_jc, content)
-        
-        def fix_pPr_justification(match):
-            pPr_content = match.group(0)
-            pPr_content = re.sub(r'"both"', '"left"', pPr_content)
-            pPr_content = re.sub(r"'both'", "'left'", pPr_content)
-            return pPr_content
-        
-        content = re.sub(r'<w:pPr>.*?</w:pPr>', fix_pPr_justification, content, flags=re.DOTALL)
-        content = re.sub(r'<w:pPrDefault>.*?</w:pPrDefault>', fix_pPr_justification, content, flags=re.DOTALL)
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True
-    
-    doc_path = os.path.join(unpacked_dir, 'word', 'document.xml')
-    process_xml_file(doc_path)
-    
-    styles_path = os.path.join(unpacked_dir, 'word', 'styles.xml')
-    process_xml_file(styles_path)
-    
-    numbering_path = os.path.join(unpacked_dir, 'word', 'numbering.xml')
-    process_xml_file(numbering_path)
-    
-    settings_path = os.path.join(unpacked_dir, 'word', 'settings.xml')
-    process_xml_file(settings_path)
+def fix_fonts_xml(content: bytes, font_name: str = "Arial") -> bytes:
+    """Replace all fonts in an XML part with a universal font and fix text alignment."""
+    # Most header, footer and settings parts have nothing to rewrite; skip the parse entirely
+    if b'rFonts' not in content and b'both' not in content:
+        return content
+    
+    parser = etree.XMLParser(huge_tree=True, remove_blank_text=False)
+    tree = etree.ElementTree(etree.fromstring(content, parser))
+    root = tree.getroot()
+    
+    for rfonts in root.iter(_W_RFONTS):
+        # Drops theme font attributes along with any other font overrides
+        rfonts.attrib.clear()
+        for attr in ('ascii', 'hAnsi', 'cs', 'eastAsia'):
+            rfonts.set(_W + attr, font_name)
+    
+    for jc in root.iter(_W_JC):
+        for key, value in jc.attrib.items():
+            if value == 'both':
+                jc.set(key, 'left')
+    
+    # Paragraph properties: no justified values anywhere inside
+    for ppr in root.iter(*_W_PPR_TAGS):
+        for element in ppr.iter():
+            for key, value in element.attrib.items():
+                if value == 'both':
+                    element.set(key, 'left')
+    
+    return etree.tostring(tree, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+# Part names fix_fonts rewrites, found in the given entries on every call
+def get_font_part_names(entries: Dict[str, bytes]) -> Tuple[str, ...]:
+    """Get the styles, numbering, settings, header and footer part names of a document."""
+    return tuple(
+        name for name in entries
+        if name in ('word/styles.xml', 'word/numbering.xml', 'word/settings.xml')
+        or (name.startswith(('word/header', 'word/footer')) and name.endswith('.xml'))
+    )
+
+
+def fix_fonts(entries: Dict[str, bytes], font_name: str = "Arial"):
+    """Standardize fonts and alignment in the styles, numbering, settings, header and footer parts.
     
-    word_dir = os.path.join(unpacked_dir, 'word')
-    if os.path.exists(word_dir):
-        for filename in os.listdir(word_dir):
-            if filename.startswith('header') and filename.endswith('.xml'):
-                process_xml_file(os.path.join(word_dir, filename))
-            if filename.startswith('footer') and filename.endswith('.xml'):
-                process_xml_file(os.path.join(word_dir, filename))
+    document.xml is handled by fill_template in the same pass as the placeholders.
+    """
+    for name in get_font_part_names(entries):
+        entries[name] = fix_fonts_xml(entries[name], font_name)
     
-    print(f"  ✓ Fonts standardized to {font_name}")
+    logger.info("  ✓ Fonts standardized to %s", font_name)
+
+
+# Sentence boundary: ". " before a capital, except after an abbreviation
+# (decimal points are never followed by whitespace, so they can't match)
+_RE_SENTENCE_END = re.compile(r'\.(?<!e\.g\.)(?<!i\.e\.)(?<!vs\.)(?<!etc\.)\s+(?=[A-Z])')
 
 
 def smart_sentence_split(text: str) -> list:
@@ -793,17 +1281,9 @@ def smart_sentence_split(text: str) -> list:
     if not text:
         return []
     
-    protected = text
-    protected = re.sub(r'(\d+)\.(\d+)', r'\1<DEC>\2', protected)
-    
-    for abbr in ['e.g.', 'i.e.', 'vs.', 'etc.']:
-        protected = protected.replace(abbr, abbr.replace('.', '<DEC>'))
-    
-    sentences = re.split(r'\.\s+(?=[A-Z])', protected)
-    
     result = []
-    for s in sentences:
-        s = s.replace('<DEC>', '.').strip()
+    for s in _RE_SENTENCE_END.split(text):
+        s = s.strip()
         if s:
             if not s.endswith('.'):
                 s += '.'
@@ -812,44 +1292,62 @@ def smart_sentence_split(text: str) -> list:
     return result
 
 
+# UTF-8 text that was decoded as cp1252 (longest first so "â€" doesn't shadow the others)
+_MOJIBAKE_FIXES = {"Â£": "£", "â€™": "'", "â€œ": '"', "â€": '"'}
+_RE_MOJIBAKE = re.compile('|'.join(sorted(_MOJIBAKE_FIXES, key=len, reverse=True)))
+# Characters outside the XML 1.0 Char range are dropped; the filled document must still parse
+_XML_INVALID_CHARS = dict.fromkeys([*range(0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0xFFFE, 0xFFFF])
+_XML_ESCAPE_TEXT = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', **_XML_INVALID_CHARS})
+
+
 def escape_xml(text: str) -> str:
-    """Escape special XML characters and fix encoding issues."""
+    """Escape special XML characters, drop characters XML can't hold and fix encoding issues."""
     if not text:
         return ""
     text = str(text)
-    text = text.replace("Â£", "£")
-    text = text.replace("â€™", "'")
-    text = text.replace("â€œ", '"')
-    text = text.replace("â€", '"')
-    text = text.replace("&", "&amp;")
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
-    text = text.replace('"', "&quot;")
-    return text
+    if 'Â' in text or 'â' in text:
+        text = _RE_MOJIBAKE.sub(lambda m: _MOJIBAKE_FIXES[m.group(0)], text)
+    return text.translate(_XML_ESCAPE_TEXT)
 
 
-def get_value_from_json(data: dict, section_key: str, field_name: str) -> str:
-    """Get a value from the JSON data using section key and field name."""
-    section_data = data.get(section_key, {})
-    if not section_data:
-        return "Not Available"
-    
-    value = section_data.get(field_name, "Not Available")
+def index_json_data(data: dict) -> Dict[Tuple[str, str], Any]:
+    """Flatten the JSON data into a (section key, field name) -> value index."""
+    return {
+        (section_key, field_name): value
+        for section_key, section_data in data.items()
+        if isinstance(section_data, dict)
+        for field_name, value in section_data.items()
+    }
+
+
+def get_value_from_json(index: Dict[Tuple[str, str], Any], section_key: str, field_name: str) -> str:
+    """Get a value from the indexed JSON data using section key and field name."""
+    value = index.get((section_key, field_name))
     return value if value else "Not Available"
 
 
-def get_soft_notes(data: dict, section_key: str, soft_notes_field: str) -> str:
+def is_empty_value(value) -> bool:
+    """Check whether an extracted value is a placeholder for missing data."""
+    if not value or value == "Not Available":
+        return True
+    text = str(value).strip()
+    # Only short values are cached; long ones (usually real answers) would just evict the placeholders
+    if len(text) > _EMPTY_VALUE_MAX_LENGTH:
+        return _RE_NORMALIZE.sub('', text.lower()).strip() in _EMPTY_VALUES
+    return _is_empty_text(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_empty_text(text: str) -> bool:
+    """Normalize a short value and check it against the placeholders; "Not found" etc. repeat a lot."""
+    return _RE_NORMALIZE.sub('', text.lower()).strip() in _EMPTY_VALUES
+
+
+def get_soft_notes(index: Dict[Tuple[str, str], Any], section_key: str, soft_notes_field: str) -> str:
     """Get soft notes for a section."""
-    value = get_value_from_json(data, section_key, soft_notes_field)
-    
-    empty_values = ["not available", "not found", "na", "n a", "none", "null", ""]
-    
-    if not value:
-        return "No notes available."
-    
-    normalized = re.sub(r'[^a-z0-9\s]', '', str(value).lower()).strip()
+    value = get_value_from_json(index, section_key, soft_notes_field)
     
-    if normalized in empty_values:
+    if is_empty_value(value):
         return "No notes available."
     
     return value
@@ -865,23 +1363,22 @@ def format_as_bullets(text: str, font_name: str = "Arial") -> str:
         return escape_xml(text)
     
     bullet_char = "•"
+    run_prefix = _run_prefix(font_name)
     
-    result = (
-        f'</w:t></w:r>'
-        f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/></w:rPr>'
-        f'<w:t>{bullet_char} {escape_xml(sentences[0])}'
-    )
-    
-    for sentence in sentences[1:]:
-        result += (
-            f'</w:t></w:r>'
-            f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/></w:rPr>'
-            f'<w:br/><w:t>{bullet_char} {escape_xml(sentence)}'
-        )
+    bullets = f'{run_prefix}<w:br/><w:t>{bullet_char} '.join(escape_xml(sentence) for sentence in sentences)
     
-    result += '</w:t></w:r><w:r><w:t>'
-    
-    return result
+    return f'{run_prefix}<w:t>{bullet_char} {bullets}</w:t></w:r><w:r><w:t>'
+
+
+_VULNERABILITY_CATEGORIES = (
+    "Health Vulnerabilities",
+    "Life Event Vulnerabilities",
+    "Capability Vulnerabilities"
+)
+_RE_VULNERABILITY_CATEGORY = re.compile(
+    r'(' + '|'.join(re.escape(cat) for cat in _VULNERABILITY_CATEGORIES) + r')\s*:\s*'
+)
+_VULNERABILITY_CATEGORIES_ESCAPED = {cat: escape_xml(cat) for cat in _VULNERABILITY_CATEGORIES}
 
 
 def format_vulnerability_soft_notes(text: str, font_name: str = "Arial") -> str:
@@ -889,18 +1386,15 @@ def format_vulnerability_soft_notes(text: str, font_name: str = "Arial") -> str:
     if not text or text == "No notes available.":
         return text
     
-    bold_categories = [
-        "Health Vulnerabilities",
-        "Life Event Vulnerabilities",
-        "Capability Vulnerabilities"
-    ]
+    bold_categories = _VULNERABILITY_CATEGORIES
     
     cleaned_text = text.replace("**", "")
-    pattern = r'(' + '|'.join(re.escape(cat) for cat in bold_categories) + r')\s*:\s*'
-    parts = re.split(pattern, cleaned_text)
+    parts = _RE_VULNERABILITY_CATEGORY.split(cleaned_text)
     
     result_parts = []
     bullet_char = "•"
+    normal_rpr = _rpr_fragment(font_name, False)
+    bold_rpr = _rpr_fragment(font_name, True)
     is_first = True
     
     i = 0
@@ -912,8 +1406,7 @@ def format_vulnerability_soft_notes(text: str, font_name: str = "Arial") -> str:
             
             if not is_first:
                 result_parts.append(
-                    f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/></w:rPr>'
-                    f'<w:br/><w:br/></w:r>'
+                    f'<w:r>{normal_rpr}<w:br/><w:br/></w:r>'
                 )
             else:
                 result_parts.append('</w:t></w:r>')
@@ -921,8 +1414,7 @@ def format_vulnerability_soft_notes(text: str, font_name: str = "Arial") -> str:
             is_first = False
             
             category_xml = (
-                f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/><w:b/></w:rPr>'
-                f'<w:t>{escape_xml(part)}:</w:t></w:r>'
+                f'<w:r>{bold_rpr}<w:t>{_VULNERABILITY_CATEGORIES_ESCAPED[part]}:</w:t></w:r>'
             )
             result_parts.append(category_xml)
             
@@ -934,8 +1426,7 @@ def format_vulnerability_soft_notes(text: str, font_name: str = "Arial") -> str:
                         continue
                     
                     bullet_xml = (
-                        f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/></w:rPr>'
-                        f'<w:br/><w:t xml:space="preserve">{bullet_char} {escape_xml(sentence)}</w:t></w:r>'
+                        f'<w:r>{normal_rpr}<w:br/><w:t xml:space="preserve">{bullet_char} {escape_xml(sentence)}</w:t></w:r>'
                     )
                     result_parts.append(bullet_xml)
             
@@ -951,31 +1442,44 @@ def format_vulnerability_soft_notes(text: str, font_name: str = "Arial") -> str:
     return final_result
 
 
-def get_hard_facts_formatted(data: dict, section_key: str, fields: list, font_name: str = "Arial") -> str:
+@functools.lru_cache(maxsize=8)
+def _rpr_fragment(font_name: str, bold: bool) -> str:
+    """Build the run properties XML for a font, optionally bold."""
+    bold_tag = '<w:b/>' if bold else ''
+    return f'<w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/>{bold_tag}</w:rPr>'
+
+
+@functools.lru_cache(maxsize=8)
+def _run_prefix(font_name: str, bold: bool = False) -> str:
+    """Close the current run and open a new one in the given font."""
+    return f'</w:t></w:r><w:r>{_rpr_fragment(font_name, bold)}'
+
+
+# Minimal XML text escaping in a single pass
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', **_XML_INVALID_CHARS})
+
+
+@functools.lru_cache(maxsize=256)
+def _escape_field_name(field: str) -> str:
+    """Escape a hard-facts field name; names come from the mapping and repeat every run."""
+    return str(field).translate(_XML_ESCAPE)
+
+
+def get_hard_facts_formatted(index: Dict[Tuple[str, str], Any], section_key: str, fields: list, font_name: str = "Arial") -> str:
     """Get hard facts formatted with each fact on a new line."""
-    section_data = data.get(section_key, {})
-    if not section_data:
-        return "No data available."
-    
-    empty_values = ["not available", "not found", "na", "n a", "none", "null", ""]
+    bold_rpr = _rpr_fragment(font_name, True)
+    normal_rpr = _rpr_fragment(font_name, False)
     
     facts = []
     for field in fields:
-        value = section_data.get(field)
-        
-        if not value:
-            continue
-        
-        normalized = re.sub(r'[^a-z0-9\s]', '', str(value).lower()).strip()
+        value = index.get((section_key, field))
         
-        if normalized not in empty_values:
-            escaped_field = str(field).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            escaped_value = str(value).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        if not is_empty_value(value):
+            escaped_field = _escape_field_name(field)
+            escaped_value = str(value).translate(_XML_ESCAPE)
             facts.append(
-                f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/><w:b/></w:rPr>'
-                f'<w:t>{escaped_field}:</w:t></w:r>'
-                f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/></w:rPr>'
-                f'<w:t xml:space="preserve"> {escaped_value}</w:t></w:r>'
+                f'<w:r>{bold_rpr}<w:t>{escaped_field}:</w:t></w:r>'
+                f'<w:r>{normal_rpr}<w:t xml:space="preserve"> {escaped_value}</w:t></w:r>'
             )
     
     if not facts:
@@ -984,41 +1488,51 @@ def get_hard_facts_formatted(data: dict, section_key: str, fields: list, font_na
     return "<w:r><w:br/></w:r>".join(facts)
 
 
-def unpack_docx(docx_path: str, output_dir: str) -> bool:
-    """Unpack a DOCX file to a directory."""
+def unpack_docx(docx_path: str) -> Optional[Dict[str, bytes]]:
+    """Read every part of a DOCX file into memory, keyed by archive name."""
     try:
-        os.makedirs(output_dir, exist_ok=True)
         with zipfile.ZipFile(docx_path, 'r') as zip_ref:
-            zip_ref.extractall(output_dir)
-        print(f"  Unpacked: {docx_path}")
-        return True
+            entries = {
+                info.filename: zip_ref.read(info)
+                for info in zip_ref.infolist()
+                if not info.is_dir()
+            }
+        logger.info("  Unpacked: %s", docx_path)
+        return entries
     except Exception as e:
-        print(f"  Error unpacking docx: {e}")
-        return False
+        logger.error("  Error unpacking docx: %s", e)
+        return None
 
 
-def pack_docx(unpacked_dir: str, output_path: str) -> bool:
-    """Pack a directory back into a DOCX file."""
+# DOCX parts that are already compressed and gain nothing from deflate
+STORED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.tif', '.tiff', '.webp', '.emz', '.wmz', '.mp4')
+
+
+def pack_docx(entries: Dict[str, bytes], output_path: str) -> bool:
+    """Write in-memory DOCX parts to a DOCX file."""
     try:
         if os.path.exists(output_path):
             os.remove(output_path)
         
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(unpacked_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    arcname = os.path.relpath(file_path, unpacked_dir)
-                    zipf.write(file_path, arcname)
+        # Fast deflate for XML; already-compressed media is stored as-is
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+            for arcname, data in entries.items():
+                if arcname.lower().endswith(STORED_EXTENSIONS):
+                    zipf.writestr(arcname, data, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zipf.writestr(arcname, data)
         
-        print(f"  Created: {output_path}")
+        logger.info("  Created: %s", output_path)
         return True
     except Exception as e:
-        print(f"  Error packing docx: {e}")
+        logger.error("  Error packing docx: %s", e)
         return False
 
 
-def replace_simple_placeholder(content: str, placeholder: str, value: str, is_hard_facts: bool = False, font_name: str = "Arial") -> str:
-    """Replace a simple placeholder with a value."""
+def replace_simple_placeholder(subs: Dict[str, str], placeholder: str, value: str, is_hard_facts: bool = False, font_name: str = "Arial") -> None:
+    """Register the replacement for a simple placeholder; the first registration wins."""
+    if not placeholder or placeholder in subs:
+        return
     
     first_page_placeholders = [
         "[Meeting Objective]",
@@ -1038,55 +1552,68 @@ def replace_simple_placeholder(content: str, placeholder: str, value: str, is_ha
         escaped_text = escape_xml(value)
         escaped_value = (
             f'</w:t></w:r>'
-            f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/></w:rPr>'
+            f'<w:r>{_rpr_fragment(font_name, False)}'
             f'<w:t xml:space="preserve">{escaped_text}</w:t></w:r>'
             f'<w:r><w:t>'
         )
     
-    xml_placeholder = placeholder.replace("&", "&amp;")
-    content = content.replace(placeholder, escaped_value)
-    content = content.replace(xml_placeholder, escaped_value)
-    return content
+    subs[placeholder] = escaped_value
+    if "&" in placeholder:
+        subs.setdefault(placeholder.replace("&", "&amp;"), escaped_value)
 
 
-def replace_split_placeholder(content: str, section_name: str, soft_notes_value: str) -> str:
-    """Replace split placeholders where [SECTION Soft Notes] is split across XML runs."""
-    if '</w:r>' in soft_notes_value or '<w:br/>' in soft_notes_value:
-        escaped_value = soft_notes_value
-    else:
-        escaped_value = escape_xml(soft_notes_value)
-    
-    xml_section_name = section_name.replace("&", "&amp;")
+@functools.lru_cache(maxsize=16)
+def _compile_placeholder_pattern(placeholders: Tuple[str, ...]) -> re.Pattern:
+    """Compile one alternation over the placeholders, longest first so none shadows a longer one."""
+    return re.compile('|'.join(re.escape(k) for k in sorted(placeholders, key=len, reverse=True)))
+
+
+def apply_placeholder_substitutions(content: str, subs: Dict[str, str]) -> str:
+    """Apply all registered placeholder replacements in a single pass."""
+    if not subs:
+        return content
+    return _compile_placeholder_pattern(tuple(subs)).sub(lambda m: subs[m.group(0)], content)
+
+
+# A [SECTION Soft Notes] placeholder that Word split across three runs
+_RE_SPLIT_PLACEHOLDER = re.compile(
+    r'(<w:t>)\[(</w:t>\s*</w:r>\s*'
+    r'<w:r[^>]*>\s*<w:rPr>\s*<w:color[^/]*/>\s*<w:szCs[^/]*/>\s*</w:rPr>\s*'
+    r'<w:t>)(?P<section>[^<]+)(</w:t>\s*</w:r>\s*'
+    r'<w:r[^>]*>\s*<w:rPr>\s*<w:color[^/]*/>\s*<w:szCs[^/]*/>\s*</w:rPr>\s*'
+    r'<w:t xml:space="preserve">) Soft Notes\](</w:t>)',
+    re.DOTALL
+)
+
+
+def replace_split_placeholder(content: str, soft_notes_values: Dict[str, str]) -> str:
+    """Replace split placeholders where [SECTION Soft Notes] is split across XML runs, in one pass."""
+    if not soft_notes_values:
+        return content
     
-    pattern = (
-        rf'(<w:t>\[</w:t>\s*</w:r>\s*'
-        rf'<w:r[^>]*>\s*<w:rPr>\s*<w:color[^/]*/>\s*<w:szCs[^/]*/>\s*</w:rPr>\s*'
-        rf'<w:t>{re.escape(xml_section_name)}</w:t>\s*</w:r>\s*'
-        rf'<w:r[^>]*>\s*<w:rPr>\s*<w:color[^/]*/>\s*<w:szCs[^/]*/>\s*</w:rPr>\s*'
-        rf'<w:t xml:space="preserve"> Soft Notes\]</w:t>)'
-    )
+    escaped_values = {}
+    for section_name, soft_notes_value in soft_notes_values.items():
+        if '</w:r>' in soft_notes_value or '<w:br/>' in soft_notes_value:
+            escaped_value = soft_notes_value
+        else:
+            escaped_value = escape_xml(soft_notes_value)
+        escaped_values[section_name.replace("&", "&amp;")] = escaped_value
     
-    def replacement(match):
-        original = match.group(0)
-        new_content = original
-        new_content = re.sub(r'<w:t>\[</w:t>', '<w:t></w:t>', new_content)
-        new_content = re.sub(
-            rf'<w:t>{re.escape(xml_section_name)}</w:t>',
-            f'<w:t>{escaped_value}</w:t>',
-            new_content
-        )
-        new_content = re.sub(
-            r'<w:t xml:space="preserve"> Soft Notes\]</w:t>',
-            '<w:t xml:space="preserve"></w:t>',
-            new_content
-        )
-        return new_content
+    def replace_match(m):
+        escaped_value = escaped_values.get(m.group("section"))
+        if escaped_value is None:
+            return m.group(0)
+        # Drop the "[" and " Soft Notes]" text and put the value in place of the section name
+        return f'{m.group(1)}{m.group(2)}{escaped_value}{m.group(4)}{m.group(5)}'
     
-    content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+    content = _RE_SPLIT_PLACEHOLDER.sub(replace_match, content)
     
     return content
 
 
+_RE_LEADING_BULLET = re.compile(r'^\s*\*\s*')
+
+
 def format_as_newlines(text: str, font_name: str = "Arial") -> str:
     """Clean up text by removing * bullets and ** markdown."""
     if not text or text == "Not Available":
@@ -1099,7 +1626,7 @@ def format_as_newlines(text: str, font_name: str = "Arial") -> str:
     
     cleaned_lines = []
     for line in lines:
-        cleaned = re.sub(r'^\s*\*\s*', '', line).strip()
+        cleaned = _RE_LEADING_BULLET.sub('', line).strip()
         cleaned = cleaned.replace('**', '')
         if cleaned:
             cleaned_lines.append(cleaned)
@@ -1107,22 +1634,19 @@ def format_as_newlines(text: str, font_name: str = "Arial") -> str:
     if not cleaned_lines:
         return escape_xml(text)
     
-    result = (
-        f'</w:t></w:r>'
-        f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/></w:rPr>'
-        f'<w:t>'
-    ) + escape_xml(cleaned_lines[0])
-    
-    for line in cleaned_lines[1:]:
-        result += (
-            f'</w:t></w:r>'
-            f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/></w:rPr>'
-            f'<w:br/><w:t>'
-        ) + escape_xml(line)
+    run_prefix = _run_prefix(font_name)
     
-    result += '</w:t></w:r><w:r><w:t>'
+    lines_xml = f'{run_prefix}<w:br/><w:t>'.join(escape_xml(line) for line in cleaned_lines)
     
-    return result
+    return f'{run_prefix}<w:t>{lines_xml}</w:t></w:r><w:r><w:t>'
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_bold_phrases(phrases: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile one alternation over the bold phrases; longest first, so it wins at a shared start."""
+    if not phrases:
+        return None
+    return re.compile('|'.join(re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True)))
 
 
 def format_as_newlines_with_bold(text: str, bold_phrases: list, font_name: str = "Arial") -> str:
@@ -1137,7 +1661,7 @@ def format_as_newlines_with_bold(text: str, bold_phrases: list, font_name: str =
     
     cleaned_lines = []
     for line in lines:
-        cleaned = re.sub(r'^\s*\*\s*', '', line).strip()
+        cleaned = _RE_LEADING_BULLET.sub('', line).strip()
         cleaned = cleaned.replace('**', '')
         if cleaned:
             cleaned_lines.append(cleaned)
@@ -1145,47 +1669,27 @@ def format_as_newlines_with_bold(text: str, bold_phrases: list, font_name: str =
     if not cleaned_lines:
         return escape_xml(text)
     
-    def apply_bold_to_line(line: str, phrases: list) -> str:
-        if not phrases:
-            return escape_xml(line)
-        
-        sorted_phrases = sorted(phrases, key=len, reverse=True)
-        
-        matches = []
-        for phrase in sorted_phrases:
-            start = 0
-            while True:
-                idx = line.find(phrase, start)
-                if idx == -1:
-                    break
-                is_covered = False
-                for existing_start, existing_end, _ in matches:
-                    if idx >= existing_start and idx < existing_end:
-                        is_covered = True
-                        break
-                if not is_covered:
-                    matches.append((idx, idx + len(phrase), phrase))
-                start = idx + 1
-        
-        if not matches:
+    bold_prefix = _run_prefix(font_name, True)
+    normal_rpr = _rpr_fragment(font_name, False)
+    bold_pattern = _compile_bold_phrases(tuple(phrase for phrase in bold_phrases if phrase))
+    
+    def apply_bold_to_line(line: str) -> str:
+        if bold_pattern is None:
             return escape_xml(line)
         
-        matches.sort(key=lambda x: x[0])
-        
         result_parts = []
         last_end = 0
         
-        for start, end, phrase in matches:
+        for match in bold_pattern.finditer(line):
+            start, end = match.span()
             if start > last_end:
                 before_text = line[last_end:start]
                 result_parts.append(escape_xml(before_text))
             
-            escaped_phrase = escape_xml(phrase)
+            escaped_phrase = escape_xml(match.group(0))
             bold_xml = (
-                f'</w:t></w:r>'
-                f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/><w:b/></w:rPr>'
-                f'<w:t>{escaped_phrase}</w:t></w:r>'
-                f'<w:r><w:rPr><w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:cs="{font_name}"/></w:rPr><w:t>'
+                f'{bold_prefix}<w:t>{escaped_phrase}</w:t></w:r>'
+                f'<w:r>{normal_rpr}<w:t>'
             )
             result_parts.append(bold_xml)
             
@@ -1196,54 +1700,78 @@ def format_as_newlines_with_bold(text: str, bold_phrases: list, font_name: str =
         
         return ''.join(result_parts)
     
-    result = apply_bold_to_line(cleaned_lines[0], bold_phrases)
-    
-    for line in cleaned_lines[1:]:
-        result += '</w:t><w:br/><w:t>' + apply_bold_to_line(line, bold_phrases)
+    return '</w:t><w:br/><w:t>'.join(apply_bold_to_line(line) for line in cleaned_lines)
+
+
+# Template parts with fonts already standardized, keyed by (path, mtime, font)
+prepared_template_cache: Dict[Tuple[str, float, str], Dict[str, bytes]] = {}
+
+
+def get_prepared_template(template_path: str, font_name: str = "Arial") -> Optional[Dict[str, bytes]]:
+    """Unpack the template and run fix_fonts on it once, reusing the result until the file changes.
     
-    return result
+    The returned parts are shared between runs and must not be modified; fill_template copies them.
+    """
+    key = (template_path, os.path.getmtime(template_path), font_name)
+    entries = prepared_template_cache.get(key)
+    if entries is None:
+        entries = unpack_docx(template_path)
+        if entries is None:
+            return None
+        fix_fonts(entries, font_name)
+        prepared_template_cache.clear()
+        prepared_template_cache[key] = entries
+    return entries
+
+
+# Leftover "[" runs from split placeholders, and values that were escaped twice
+_FINAL_CLEANUP = {'<w:t>[</w:t>': '<w:t></w:t>', '&amp;amp;': '&amp;'}
+_RE_FINAL_CLEANUP = re.compile('|'.join(re.escape(k) for k in _FINAL_CLEANUP))
 
 
-def fill_template(template_dir: str, output_dir: str, data: dict, mapping_config: dict):
-    """Fill the template with data using the mapping configuration."""
-    if os.path.exists(output_dir):
-        shutil.rmtree(output_dir)
-    shutil.copytree(template_dir, output_dir)
+def fill_template(template_entries: Dict[str, bytes], data: dict, mapping_config: dict, font_name: str = "Arial") -> Dict[str, bytes]:
+    """Fill the template with data using the mapping configuration and standardize its fonts.
     
-    doc_path = os.path.join(output_dir, 'word', 'document.xml')
-    with open(doc_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    Returns a new set of DOCX parts; the template parts are not modified.
+    """
+    entries = dict(template_entries)
+    content = entries['word/document.xml'].decode('utf-8')
     
     sections_config = mapping_config.get("sections", {})
     split_sections = mapping_config.get("split_placeholder_sections", [])
     bold_phrases_config = mapping_config.get("bold_phrases", {})
     
     today_date = datetime.now().strftime("%d-%B-%Y")
+    # Set on the index rather than the caller's (possibly cached) data
+    index = index_json_data(data)
     if "Meeting" in data:
-        data["Meeting"]["Document Generation Date"] = today_date
+        index[("Meeting", "Document Generation Date")] = today_date
+    
+    subs: Dict[str, str] = {}
+    split_values: Dict[str, str] = {}
     
     # Process Meeting section
     meeting_config = sections_config.get("Meeting", {})
     meeting_json_key = meeting_config.get("json_key", "Meeting")
     
     for placeholder, field_name in meeting_config.get("placeholders", {}).items():
-        value = get_value_from_json(data, meeting_json_key, field_name)
+        value = get_value_from_json(index, meeting_json_key, field_name)
         
         if placeholder == "[Summary of Discussion]" and value != "Not Available":
             bold_phrases = bold_phrases_config.get("Summary of Discussion", [])
             formatted_value = format_as_newlines_with_bold(value, bold_phrases)
-            content = replace_simple_placeholder(content, placeholder, formatted_value, is_hard_facts=True)
+            replace_simple_placeholder(subs, placeholder, formatted_value, is_hard_facts=True)
         elif placeholder == "[Actions & Recommendations]" and value != "Not Available":
             bold_phrases = bold_phrases_config.get("Actions & Recommendations", [])
             formatted_value = format_as_newlines_with_bold(value, bold_phrases)
-            content = replace_simple_placeholder(content, placeholder, formatted_value, is_hard_facts=True)
+            replace_simple_placeholder(subs, placeholder, formatted_value, is_hard_facts=True)
         elif placeholder == "[Next Steps]" and value != "Not Available":
             formatted_value = format_as_newlines(value)
-            content = replace_simple_placeholder(content, placeholder, formatted_value, is_hard_facts=True)
+            replace_simple_placeholder(subs, placeholder, formatted_value, is_hard_facts=True)
         else:
-            content = replace_simple_placeholder(content, placeholder, value)
+            replace_simple_placeholder(subs, placeholder, value)
     
-    print("  ✓ Meeting section filled")
+    logger.debug("  ✓ Meeting section filled")
     
     # Process each data section
     for section_name, section_config in sections_config.items():
@@ -1254,7 +1782,7 @@ def fill_template(template_dir: str, output_dir: str, data: dict, mapping_config
         
         soft_notes_field = section_config.get("soft_notes_field", "")
         soft_notes_placeholder = section_config.get("soft_notes_placeholder", "")
-        soft_notes_raw = get_soft_notes(data, json_key, soft_notes_field)
+        soft_notes_raw = get_soft_notes(index, json_key, soft_notes_field)
         
         if section_name == "Vulnerability" and soft_notes_raw != "No notes available.":
             soft_notes_value = format_vulnerability_soft_notes(soft_notes_raw)
@@ -1265,29 +1793,30 @@ def fill_template(template_dir: str, output_dir: str, data: dict, mapping_config
         
         hard_facts_placeholder = section_config.get("hard_facts_placeholder", "")
         hard_facts_fields = section_config.get("hard_facts_fields", [])
-        hard_facts_value = get_hard_facts_formatted(data, json_key, hard_facts_fields)
+        hard_facts_value = get_hard_facts_formatted(index, json_key, hard_facts_fields)
         
-        original_content = content
-        content = replace_simple_placeholder(content, soft_notes_placeholder, soft_notes_value, is_hard_facts=True)
-        
-        if content == original_content and section_name in split_sections:
-            content = replace_split_placeholder(content, section_name, soft_notes_value)
+        if (section_name in split_sections
+                and soft_notes_placeholder not in content
+                and soft_notes_placeholder.replace("&", "&amp;") not in content):
+            split_values[section_name] = soft_notes_value
+        else:
+            replace_simple_placeholder(subs, soft_notes_placeholder, soft_notes_value, is_hard_facts=True)
         
-        content = replace_simple_placeholder(content, hard_facts_placeholder, hard_facts_value, is_hard_facts=True)
+        replace_simple_placeholder(subs, hard_facts_placeholder, hard_facts_value, is_hard_facts=True)
         
         for placeholder, field_name in section_config.get("additional_placeholders", {}).items():
-            value = get_value_from_json(data, json_key, field_name)
-            content = replace_simple_placeholder(content, placeholder, value)
+            value = get_value_from_json(index, json_key, field_name)
+            replace_simple_placeholder(subs, placeholder, value)
         
-        print(f"  ✓ {section_name} section filled")
+        logger.debug("  ✓ %s section filled", section_name)
     
-    content = content.replace('<w:t>[</w:t>', '<w:t></w:t>')
-    content = content.replace("&amp;amp;", "&amp;")
+    content = replace_split_placeholder(content, split_values)
+    content = apply_placeholder_substitutions(content, subs)
+    content = _RE_FINAL_CLEANUP.sub(lambda m: _FINAL_CLEANUP[m.group(0)], content)
+    entries['word/document.xml'] = fix_fonts_xml(content.encode('utf-8'), font_name)
     
-    with open(doc_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print("  ✓ Template filled successfully")
+    logger.info("  ✓ Template filled successfully")
+    return entries
 
 
 # =============================================================================
@@ -1296,119 +1825,112 @@ def fill_template(template_dir: str, output_dir: str, data: dict, mapping_config
 
 def run_fpq_extraction(transcript_text: str, output_dir: str) -> Optional[str]:
     """Extract data from transcript and generate JSON output."""
-    print("\n" + "=" * 60)
-    print("STEP 1: FPQ EXTRACTION")
-    print("=" * 60)
+    logger.info("\n%s\nSTEP 1: FPQ EXTRACTION\n%s", "=" * 60, "=" * 60)
     
     json_output_name = "final_output.json"
     
     try:
         # Load field definitions
-        print("\n[1.1] Loading field definitions from Excel...")
+        logger.info("\n[1.1] Loading field definitions from Excel...")
         field_schema = load_field_definitions_from_excel(EXCEL_PATH, sheet_name=SHEET_NAME)
-        print(f"  ✓ Loaded field schema")
-        
-        print(f"  ✓ Transcript loaded ({len(transcript_text)} characters)")
+        logger.info("  ✓ Loaded field schema\n  ✓ Transcript loaded (%d characters)", len(transcript_text))
         
         # Extract reasoning
-        print("\n[1.2] Extracting fields (Reasoning step)...")
+        logger.info("\n[1.2] Extracting fields (Reasoning step)...")
         extracted_output = extract_all_fields(transcript_text, field_schema)
-        print("  ✓ Reasoning extraction complete")
+        logger.info("  ✓ Reasoning extraction complete")
         
         # Save reasoning output
         step1_path = os.path.join(output_dir, "step-1_reasoning.txt")
-        with open(step1_path, "w", encoding="utf-8") as f:
-            f.write(extracted_output)
-        print(f"  ✓ Reasoning saved: {step1_path}")
-        
-        time.sleep(2)
+        reasoning_bytes = extracted_output.encode("utf-8")
+        reasoning_write = io_executor.submit(atomic_write, step1_path, reasoning_bytes)
         
         # Generate final JSON
-        print("\n[1.3] Generating final JSON...")
-        content = generate_json(extracted_output)
-        parsed_json = json.loads(content)
+        logger.info("\n[1.3] Generating final JSON...")
+        parsed_json = parse_reasoning(extracted_output, field_schema)
+        if not any(value != "Not found" for fields in parsed_json.values() for value in fields.values()):
+            logger.warning("  Could not parse reasoning output, converting with Gemini API instead...")
+            time.sleep(2)
+            content = generate_json(extracted_output)
+            parsed_json = json.loads(content)
         
         # Save JSON output
         json_output_path = os.path.join(output_dir, json_output_name)
-        with open(json_output_path, "w", encoding="utf-8") as f:
-            json.dump(parsed_json, f, indent=4, ensure_ascii=False)
-        print(f"  ✓ JSON saved: {json_output_path}")
+        json_bytes = json.dumps(parsed_json, indent=4, ensure_ascii=False).encode("utf-8")
+        json_write = io_executor.submit(atomic_write, json_output_path, json_bytes)
+        
+        reasoning_write.result()
+        logger.info("  ✓ Reasoning saved: %s", step1_path)
+        json_write.result()
+        logger.info("  ✓ JSON saved: %s", json_output_path)
         
-        print("\n" + "-" * 60)
-        print("FPQ EXTRACTION COMPLETE")
-        print("-" * 60)
+        logger.info("\n%s\nFPQ EXTRACTION COMPLETE\n%s", "-" * 60, "-" * 60)
         
         return json_output_path
         
     except Exception as e:
-        print(f"\n  ✗ ERROR during extraction: {str(e)}")
+        logger.error("\n  ✗ ERROR during extraction: %s", e)
         return None
 
 
 def run_pdf_generation(json_path: str, output_dir: str) -> Optional[str]:
     """Generate PDF from JSON data using template."""
-    print("\n" + "=" * 60)
-    print("STEP 2: PDF GENERATION")
-    print("=" * 60)
+    logger.info("\n%s\nSTEP 2: PDF GENERATION\n%s", "=" * 60, "=" * 60)
     
     pdf_output_name = "final_output.pdf"
     pdf_output_path = os.path.join(output_dir, pdf_output_name)
     
     # Validate input files
-    print("\n[2.1] Validating input files...")
+    logger.info("\n[2.1] Validating input files...")
     for name, path in [("JSON", json_path), ("Template", TEMPLATE_PATH)]:
         if not os.path.exists(path):
-            print(f"  ✗ ERROR: {name} file not found: {path}")
+            logger.error("  ✗ ERROR: %s file not found: %s", name, path)
             return None
-        print(f"  ✓ {name}: {path}")
+        logger.info("  ✓ %s: %s", name, path)
     
-    # Create temp directories
+    # Create temp directory for the intermediate document
     work_dir = tempfile.mkdtemp(prefix="ehon_fill_")
-    template_unpacked = os.path.join(work_dir, "template_unpacked")
-    filled_unpacked = os.path.join(work_dir, "filled_unpacked")
     
     try:
         # Load JSON data
-        print("\n[2.2] Loading JSON data...")
+        logger.info("\n[2.2] Loading JSON data...")
         data = load_json_file(json_path)
-        print(f"  ✓ Loaded {len(data)} sections")
+        logger.info("  ✓ Loaded %d sections", len(data))
         
-        # Unpack template
-        print("\n[2.3] Unpacking template...")
-        if not unpack_docx(TEMPLATE_PATH, template_unpacked):
-            print("  ✗ Failed to unpack template")
+        # Unpack template (fonts already standardized, cached per process)
+        logger.info("\n[2.3] Unpacking template...")
+        template_entries = get_prepared_template(TEMPLATE_PATH)
+        if template_entries is None:
+            logger.error("  ✗ Failed to unpack template")
             return None
-        print("  ✓ Template unpacked")
+        logger.info("  ✓ Template unpacked")
         
         # Fill template
-        print("\n[2.4] Filling template with data...")
-        fill_template(template_unpacked, filled_unpacked, data, TEMPLATE_MAPPING)
-        fix_fonts(filled_unpacked)
-        print("  ✓ Template filled")
+        logger.info("\n[2.4] Filling template with data...")
+        filled_entries = fill_template(template_entries, data, TEMPLATE_MAPPING)
+        logger.info("  ✓ Template filled")
         
         # Pack output (temporary docx)
-        print("\n[2.5] Creating intermediate document...")
+        logger.info("\n[2.5] Creating intermediate document...")
         temp_docx = os.path.join(work_dir, "temp_output.docx")
-        if not pack_docx(filled_unpacked, temp_docx):
-            print("  ✗ Failed to pack document")
+        if not pack_docx(filled_entries, temp_docx):
+            logger.error("  ✗ Failed to pack document")
             return None
-        print("  ✓ Intermediate document created")
+        logger.info("  ✓ Intermediate document created")
         
         # Convert to PDF
-        print("\n[2.6] Converting to PDF...")
+        logger.info("\n[2.6] Converting to PDF...")
         if not convert_docx_to_pdf(temp_docx, pdf_output_path):
-            print("  ✗ Failed to convert to PDF")
+            logger.error("  ✗ Failed to convert to PDF")
             return None
-        print(f"  ✓ PDF saved: {pdf_output_path}")
+        logger.info("  ✓ PDF saved: %s", pdf_output_path)
         
-        print("\n" + "-" * 60)
-        print("PDF GENERATION COMPLETE")
-        print("-" * 60)
+        logger.info("\n%s\nPDF GENERATION COMPLETE\n%s", "-" * 60, "-" * 60)
         
         return pdf_output_path
         
     except Exception as e:
-        print(f"\n  ✗ ERROR during PDF generation: {str(e)}")
+        logger.error("\n  ✗ ERROR during PDF generation: %s", e)
         return None
         
     finally:
@@ -1420,6 +1942,64 @@ def run_pdf_generation(json_path: str, output_dir: str) -> Optional[str]:
 # API ENDPOINTS
 # =============================================================================
 
+def log_pdf_worker_start(future):
+    """Log a PDF worker that failed to start."""
+    if future.exception() is not None:
+        logger.error("  ✗ PDF worker failed to start: %s", future.exception())
+
+
+def start_pdf_executor() -> ProcessPoolExecutor:
+    """Create the PDF worker pool and spawn its workers, each with its own LibreOffice server."""
+    mp_context = multiprocessing.get_context("spawn")
+    executor = ProcessPoolExecutor(
+        max_workers=PDF_WORKERS,
+        mp_context=mp_context,
+        initializer=init_pdf_worker,
+        initargs=(mp_context.Value('i', 0),)
+    )
+    # The pool starts workers lazily; one trivial task per worker spawns them (and runs
+    # init_pdf_worker) now, and any startup failure is logged when its task completes
+    for _ in range(PDF_WORKERS):
+        executor.submit(os.getpid).add_done_callback(log_pdf_worker_start)
+    return executor
+
+
+async def generate_pdf(json_path: str, output_dir: str) -> Optional[str]:
+    """Run run_pdf_generation in the worker pool, replacing the pool and retrying once if a worker died."""
+    global pdf_executor
+    loop = asyncio.get_running_loop()
+    executor = pdf_executor
+    try:
+        return await loop.run_in_executor(executor, run_pdf_generation, json_path, output_dir)
+    except BrokenProcessPool as e:
+        logger.warning("  PDF worker pool is broken, restarting it: %s", e)
+    
+    async with pdf_executor_lock:
+        # Concurrent requests share the broken pool; only the first one replaces it
+        if pdf_executor is executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+            pdf_executor = start_pdf_executor()
+        executor = pdf_executor
+    return await loop.run_in_executor(executor, run_pdf_generation, json_path, output_dir)
+
+
+@app.on_event("startup")
+async def startup():
+    """Start the PDF workers and their LibreOffice servers so conversions skip the cold start."""
+    global pdf_executor
+    # tiktoken downloads its encoding on first use; do that now rather than inside a request
+    await asyncio.get_running_loop().run_in_executor(None, get_token_encoder)
+    pdf_executor = start_pdf_executor()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the PDF workers and LibreOffice servers."""
+    if pdf_executor is not None:
+        pdf_executor.shutdown(wait=True)
+    stop_office_server()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -1458,6 +2038,8 @@ async def process_transcript(
     transcript_extensions = ['.txt', '.vtt', '.docx']
     
     try:
+        loop = asyncio.get_running_loop()
+        
         # Save uploaded file
         temp_file_path = os.path.join(output_dir, file.filename)
         with open(temp_file_path, "wb") as buffer:
@@ -1475,7 +2057,9 @@ async def process_transcript(
                 )
             
             print(f"Processing audio file: {filename}")
-            formatted_transcript, plain_transcript = transcribe_with_diarization(temp_file_path)
+            formatted_transcript, plain_transcript = await loop.run_in_executor(
+                None, transcribe_with_diarization, temp_file_path
+            )
             
             if formatted_transcript is None:
                 raise HTTPException(
@@ -1493,7 +2077,7 @@ async def process_transcript(
         elif file_extension in transcript_extensions:
             # Transcript file - use directly
             print(f"Processing transcript file: {filename}")
-            transcript_text = read_transcript(temp_file_path)
+            transcript_text = await loop.run_in_executor(None, read_transcript, temp_file_path)
             
         else:
             raise HTTPException(
@@ -1506,8 +2090,8 @@ async def process_transcript(
         with open(transcript_output_path, "w", encoding="utf-8") as f:
             f.write(transcript_text)
         
-        # Run FPQ Extraction
-        json_output_path = run_fpq_extraction(transcript_text, output_dir)
+        # Run FPQ Extraction off the event loop; it blocks on the LLM calls
+        json_output_path = await loop.run_in_executor(None, run_fpq_extraction, transcript_text, output_dir)
         
         if json_output_path is None:
             raise HTTPException(
@@ -1515,8 +2099,14 @@ async def process_transcript(
                 detail="Failed during FPQ extraction step"
             )
         
-        # Run PDF Generation
-        pdf_output_path = run_pdf_generation(json_output_path, output_dir)
+        # Run PDF Generation in a worker process so concurrent requests convert in parallel
+        try:
+            pdf_output_path = await generate_pdf(json_output_path, output_dir)
+        except BrokenProcessPool:
+            raise HTTPException(
+                status_code=503,
+                detail="PDF workers are restarting, please retry"
+            )
         
         if pdf_output_path is None:
             raise HTTPException(